@@ -1,6 +1,6 @@
 import numpy as np
 
-from ..sile import add_sile, sile_fh_open
+from ..sile import add_sile, sile_fh_open, SileError
 from .sile import SileSiesta
 
 from sisl._internal import set_module
@@ -46,22 +46,25 @@ class bandsSileSiesta(SileSiesta):
             l = self.readline()
         no, ns, nk = map(int, l.split())
 
-        # Create the data to contain all band points
-        b = _a.emptyd([nk, ns, no])
+        # Number of k-point values (1 for band-lines, 3 for band-points)
+        if band_lines:
+            nkv = 1
+        else:
+            nkv = 3
+
+        # Read all k-points and eigenvalues and convert them in one go
+        l = []
+        while len(l) < nk * (nkv + ns * no):
+            line = self.readline()
+            if not line:
+                raise SileError(f"{self!s}: unexpected end of file while reading eigenvalues")
+            l.extend(line.split())
+        l = _a.arrayd(l).reshape(nk, nkv + ns * no)
+        b = l[:, nkv:].reshape(nk, ns, no) - Ef
 
         # for band-lines
         if band_lines:
-            k = _a.emptyd([nk])
-            for ik in range(nk):
-                l = [float(x) for x in self.readline().split()]
-                k[ik] = l[0]
-                del l[0]
-                # Now populate the eigenvalues
-                while len(l) < ns * no:
-                    l.extend([float(x) for x in self.readline().split()])
-                l = _a.arrayd(l)
-                l.shape = (ns, no)
-                b[ik, :, :] = l[:, :] - Ef
+            k = l[:, 0].copy()
             # Now we need to read the labels for the points
             xlabels = []
             labels = []
@@ -73,19 +76,7 @@ class bandsSileSiesta(SileSiesta):
             vals = (xlabels, labels), k, b
 
         else:
-            k = _a.emptyd([nk, 3])
-            for ik in range(nk):
-                l = [float(x) for x in self.readline().split()]
-                k[ik, :] = l[0:3]
-                del l[2]
-                del l[1]
-                del l[0]
-                # Now populate the eigenvalues
-                while len(l) < ns * no:
-                    l.extend([float(x) for x in self.readline().split()])
-                l = _a.arrayd(l)
-                l.shape = (ns, no)
-                b[ik, :, :] = l[:, :] - Ef
+            k = l[:, :3].copy()
             vals = k, b
 
         if as_dataarray:
@@ -142,20 +133,24 @@ class bandsSileSiesta(SileSiesta):
                     # We do not plot "points"
                     raise ValueError("The bands file only contains points in the BZ, not a bandstructure.")
                 lbls, k, b = ns._bands
-                b = b.T
+                # Contiguous [spin, band, k] layout, each band is then a contiguous row
+                b = np.ascontiguousarray(b.transpose(1, 2, 0))
                 # Extract to tick-marks and names
                 xlbls, lbls = lbls
 
                 def myplot(ax, title, x, y, E):
                     ax.set_title(title)
-                    for ib in range(y.shape[0]):
-                        ax.plot(x, y[ib, :])
+                    if not E is None:
+                        # Only plot bands that cross the energy range
+                        y = y[(y.max(1) >= E[0]) & (y.min(1) <= E[1])]
+                    # Plot all bands (columns) in a single call
+                    ax.plot(x, y.T)
                     ax.set_ylabel('E-Ef [eV]')
                     ax.set_xlim(x.min(), x.max())
                     if not E is None:
                         ax.set_ylim(E[0], E[1])
 
-                if b.shape[1] == 2:
+                if b.shape[0] == 2:
                     _, ax = plt.subplots(2, 1)
                     ax[0].set_xticks(xlbls)
                     ax[0].set_xticklabels([''] * len(xlbls))
@@ -163,13 +158,13 @@ class bandsSileSiesta(SileSiesta):
                     ax[1].set_xticklabels(lbls, rotation=45)
                     # We must plot spin-up/down separately
                     for i, ud in enumerate(['UP', 'DOWN']):
-                        myplot(ax[i], 'Bandstructure SPIN-'+ud, k, b[:, i, :], ns._Emap)
+                        myplot(ax[i], 'Bandstructure SPIN-'+ud, k, b[i], ns._Emap)
                 else:
                     plt.figure()
                     ax = plt.gca()
                     ax.set_xticks(xlbls)
                     ax.set_xticklabels(lbls, rotation=45)
-                    myplot(ax, 'Bandstructure', k, b[:, 0, :], ns._Emap)
+                    myplot(ax, 'Bandstructure', k, b[0], ns._Emap)
                 if value is None:
                     plt.show()
                 else:
@@ -2,6 +2,7 @@
 
 import pytest
 import os.path as osp
+import numpy as np
 import sisl
 
 
@@ -36,3 +37,64 @@ def test_fe_xarray(sisl_files, sisl_tmp):
     assert len(bands['spin']) == 2
     assert len(bands['band']) == 15
     assert len(bands.ticks) == len(bands.ticklabels) == 5
+
+
+def _write_values(fh, values, head=''):
+    """ Write values 10 per line (as Siesta) with `head` preceding the first line """
+    for i in range(0, len(values), 10):
+        fh.write('{:>10s}'.format(head if i == 0 else ''))
+        fh.write(''.join(f'{v:12.4f}' for v in values[i:i + 10]) + '\n')
+
+
+def test_bands_lines(sisl_tmp):
+    f = sisl_tmp('lines.bands', _dir)
+    nk, ns, no = 4, 2, 7
+    eig = np.arange(nk * ns * no, dtype=np.float64).reshape(nk, ns, no) / 10
+    k = np.linspace(0, 1, nk)
+    with open(f, 'w') as fh:
+        fh.write('  1.5\n  0.0  1.0\n  -10.0  10.0\n')
+        fh.write(f'{no} {ns} {nk}\n')
+        for ik in range(nk):
+            _write_values(fh, eig[ik].ravel(), head=f'{k[ik]:.6f}')
+        fh.write('3\n')
+        fh.write("  0.000000  'Gamma'\n  0.500000  'M point'\n  1.000000  'K'\n")
+
+    (xlabels, labels), K, b = sisl.get_sile(f).read_data()
+    assert np.allclose(K, k)
+    assert b.shape == (nk, ns, no)
+    assert np.allclose(b, eig - 1.5)
+    assert np.allclose(xlabels, [0, 0.5, 1])
+    assert labels == ['Gamma', 'M point', 'K']
+
+
+def test_bands_points(sisl_tmp):
+    f = sisl_tmp('points.bands', _dir)
+    nk, ns, no = 3, 1, 12
+    eig = np.arange(nk * ns * no, dtype=np.float64).reshape(nk, ns, no) / 10
+    k = np.arange(nk * 3, dtype=np.float64).reshape(nk, 3) / 10
+    with open(f, 'w') as fh:
+        fh.write('  -0.5\n  0.0  1.0\n')
+        fh.write(f'{no} {ns} {nk}\n')
+        for ik in range(nk):
+            _write_values(fh, np.concatenate([k[ik], eig[ik].ravel()]))
+
+    K, b = sisl.get_sile(f).read_data()
+    assert np.allclose(K, k)
+    assert b.shape == (nk, ns, no)
+    assert np.allclose(b, eig + 0.5)
+
+
+def test_bands_truncated(sisl_tmp):
+    f = sisl_tmp('truncated.bands', _dir)
+    nk, ns, no = 3, 1, 12
+    eig = np.arange(nk * ns * no, dtype=np.float64).reshape(nk, ns, no) / 10
+    k = np.linspace(0, 1, nk)
+    with open(f, 'w') as fh:
+        fh.write('  1.5\n  0.0  1.0\n  -10.0  10.0\n')
+        fh.write(f'{no} {ns} {nk}\n')
+        # only write the eigenvalues for the first k-points
+        for ik in range(nk - 1):
+            _write_values(fh, eig[ik].ravel(), head=f'{k[ik]:.6f}')
+
+    with pytest.raises(sisl.SileError):
+        sisl.get_sile(f).read_data()
@@ -1,4 +1,4 @@
-from functools import wraps
+from functools import wraps, lru_cache
 from os.path import splitext, isfile, dirname, join, abspath, basename
 import gzip
 from pathlib import Path
@@ -44,6 +44,11 @@ __all__ += ['sile_fh_open',
 # same extension and query it based on a sub-class
 __sile_rules = []
 __siles = []
+# Look-up tables of indices into __sile_rules based on the file suffix.
+# Case-insensitive rules are stored by their lower-cased suffix, and rules
+# accepting gzipped files are also stored with the ``.gz`` suffix.
+__sile_suffix_case = {}
+__sile_suffix_nocase = {}
 
 
 class _sile_rule:
@@ -167,7 +172,27 @@ def add_sile(suffix, cls, case=True, gzip=False):
         __siles.append(cls)
 
     # Add the rule of the sile to the list of rules.
-    __sile_rules.append(_sile_rule(cls, suffix, case=case, gzip=gzip))
+    rule = _sile_rule(cls, suffix, case=case, gzip=gzip)
+    idx = len(__sile_rules)
+    __sile_rules.append(rule)
+
+    # Add the rule to the suffix look-up tables
+    if case:
+        suffixes = __sile_suffix_case
+    else:
+        suffixes = __sile_suffix_nocase
+    suffixes.setdefault(rule.suffix, []).append(idx)
+    if gzip:
+        suffixes.setdefault(rule.suffix + ".gz", []).append(idx)
+
+    # Previously looked up files may now resolve differently
+    _get_sile_class_file.cache_clear()
+
+
+def _get_sile_rules(suffix):
+    """ Return the rules matching `suffix` (in the order they were added) """
+    idx = __sile_suffix_case.get(suffix, []) + __sile_suffix_nocase.get(suffix.lower(), [])
+    return [__sile_rules[i] for i in sorted(idx)]
 
 
 @set_module("sisl.io")
@@ -215,54 +240,59 @@ def get_sile_class(filename, *args, **kwargs):
                 filename = tmp_file
                 break
 
-    try:
-        # Create list of endings on this file
-        f = basename(filename)
-        end_list = []
-        end = ''
-
-        # Check for files without ending, or that they are directly zipped
-        lext = splitext(f)
-        while len(lext[1]) > 0:
-            end = lext[1] + end
-            if end[0] == '.':
-                end_list.append(end[1:])
-            else:
-                end_list.append(end)
-            lext = splitext(lext[0])
-
-        # We also check the entire file name
-        #  (mainly for VASP)
-        end_list.append(f)
-        # Reverse to start by the longest extension
-        # (allows grid.nc extensions, etc.)
-        end_list = list(reversed(end_list))
-
-        # First we check for class AND file ending
-        clss = None
-        for end in end_list:
-            for sr in __sile_rules:
-                if sr.is_class(cls):
-                    # class-specification has precedence
-                    # This should only occur when the
-                    # class-specification is exact (i.e. xyzSile)
-                    return sr.cls
-                elif sr.is_suffix(end):
-                    if cls is None:
-                        return sr.cls
-                    elif sr.is_subclass(cls):
-                        return sr.cls
-                    clss = sr.cls
-            if clss is not None:
-                return clss
-
-        if clss is None:
-            raise NotImplementedError("Sile for file '{}' could not be found, "
-                                      "possibly the file has not been implemented.".format(filename))
-        return clss
-
-    except Exception as e:
-        raise e
+    # class-specification has precedence
+    # This should only occur when the
+    # class-specification is exact (i.e. xyzSile)
+    if cls in __siles:
+        return cls
+
+    clss = _get_sile_class_file(basename(filename), cls)
+    if clss is None:
+        raise NotImplementedError("Sile for file '{}' could not be found, "
+                                  "possibly the file has not been implemented.".format(filename))
+    return clss
+
+
+@lru_cache(maxsize=1024)
+def _get_sile_class_file(f, cls):
+    """ Return the sile class for the file name `f` (a base-name) and the (optional) base-class `cls`
+
+    Returns ``None`` if no sile is associated with the file.
+    The result is cached, the cache is cleared whenever a new sile is added.
+    """
+    # Create list of endings on this file
+    end_list = []
+    end = ''
+
+    # Check for files without ending, or that they are directly zipped
+    lext = splitext(f)
+    while len(lext[1]) > 0:
+        end = lext[1] + end
+        if end[0] == '.':
+            end_list.append(end[1:])
+        else:
+            end_list.append(end)
+        lext = splitext(lext[0])
+
+    # We also check the entire file name
+    #  (mainly for VASP)
+    end_list.append(f)
+    # Reverse to start by the longest extension
+    # (allows grid.nc extensions, etc.)
+    end_list = list(reversed(end_list))
+
+    # Now we check for class AND file ending
+    clss = None
+    for end in end_list:
+        for sr in _get_sile_rules(end):
+            if cls is None:
+                return sr.cls
+            elif sr.is_subclass(cls):
+                return sr.cls
+            clss = sr.cls
+        if clss is not None:
+            return clss
+    return None
 
 
 @set_module("sisl.io")
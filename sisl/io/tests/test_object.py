@@ -56,6 +56,33 @@ def test_get_sile2():
         gsc("test.this_file_does_not_exist")
 
 
+def test_get_sile_cache():
+    # the file-name look-up is cached, ensure the cache follows add_sile
+    # and that different cls arguments are resolved independently
+    class _ABase(Sile):
+        pass
+
+    class _BBase(Sile):
+        pass
+
+    class _ASile(_ABase):
+        pass
+
+    class _BSile(_BBase):
+        pass
+
+    with pytest.raises(NotImplementedError):
+        gsc("test.sisl_cache_suffix")
+
+    add_sile("sisl_cache_suffix", _ASile)
+    assert gsc("test.sisl_cache_suffix") is _ASile
+
+    add_sile("sisl_cache_suffix", _BSile)
+    assert gsc("test.sisl_cache_suffix", cls=_ABase) is _ASile
+    assert gsc("test.sisl_cache_suffix", cls=_BBase) is _BSile
+    assert gsc("test.sisl_cache_suffix", cls=_ABase) is _ASile
+
+
 class TestObject:
 
     def test_siesta_sources(self):
@@ -4,6 +4,7 @@ from numpy import ndarray, bool_
 
 from sisl._internal import set_module
 import sisl._array as _a
+from sisl.linalg import linalg_info
 from sisl.messages import warn
 
 
@@ -12,17 +13,81 @@ __all__ = ['Coefficient', 'State', 'StateC']
 _abs = np.absolute
 _phase = np.angle
 _argmax = np.argmax
-_append = np.append
 _diff = np.diff
 _dot = np.dot
-_conj = np.conjugate
 _outer_ = np.outer
-_pi = np.pi
-_pi2 = np.pi * 2
 
 
-def _inner(v1, v2):
-    return _dot(_conj(v1), v2)
+def _conj(v):
+    """ Complex conjugate of `v`, real arrays are returned as is (no copy) """
+    if np.iscomplexobj(v):
+        return np.conjugate(v)
+    return v
+
+
+def _outer_herm(v):
+    r""" Calculate the Hermitian matrix :math:`v^T v^*`, through a rank-k update (only one triangle is computed) when beneficial """
+    n, m = v.shape
+    dtype = v.dtype.type
+    # For few states the mirroring of the triangle costs more than it saves
+    if n * 4 < m:
+        return _dot(v.T, _conj(v))
+    elif dtype in (np.complex64, np.complex128):
+        rk = linalg_info('herk', dtype)
+    elif dtype in (np.float32, np.float64):
+        rk = linalg_info('syrk', dtype)
+    else:
+        return _dot(v.T, _conj(v))
+    # BLAS calculates the upper triangular part, copy it to the lower part
+    out = rk(1., v.T)
+    out += _conj(np.triu(out, 1)).T
+    return out
+
+
+def _atleast_1d(a):
+    """ Same as `numpy.atleast_1d`, but bypassing it for arrays that already are 1D (or more) """
+    if isinstance(a, ndarray) and a.ndim >= 1:
+        return a
+    return np.atleast_1d(a)
+
+
+def _atleast_2d(a):
+    """ Same as `numpy.atleast_2d`, but bypassing it for arrays that already are 2D (or more) """
+    if isinstance(a, ndarray) and a.ndim >= 2:
+        return a
+    return np.atleast_2d(a)
+
+
+def _inner_diag(v):
+    r""" Row-wise :math:`\langle v_i|v_i\rangle` calculated on the real representation of `v` (no temporary arrays) """
+    if np.iscomplexobj(v):
+        # A complex row is equivalent to a real row of twice the length
+        v = np.ascontiguousarray(v)
+        v = v.view(v.real.dtype)
+    return einsum('ij,ij->i', v, v)
+
+
+def _abs2(v):
+    r""" Element-wise :math:`|v|^2` as a real array """
+    if np.iscomplexobj(v):
+        return v.real ** 2 + v.imag ** 2
+    return v ** 2
+
+
+def _degenerate(c, eps, assume_sorted=False):
+    r""" Find groups of indices in `c` whose (sorted) values are within `eps` of each other """
+    if assume_sorted:
+        sidx = _a.arangei(len(c))
+    else:
+        # a stable sort is close to linear for (nearly) sorted coefficients
+        sidx = np.argsort(c, kind='stable')
+        c = c[sidx]
+    # Whether a sorted coefficient is degenerate with the following one
+    deg = _diff(c) < eps
+    # Start and end of each consecutive run of degenerate pairs
+    runs = np.flatnonzero(_diff(np.concatenate(([False], deg, [False])))).reshape(-1, 2)
+    # A run [start, stop[ of pairs includes coefficients up to (and including) stop
+    return [sidx[start:stop + 1] for start, stop in runs]
 
 
 @set_module("sisl.physics")
@@ -70,7 +135,7 @@ class Coefficient(ParentContainer):
 
     def __init__(self, c, parent=None, **info):
         super().__init__(parent, **info)
-        self.c = np.atleast_1d(c)
+        self.c = _atleast_1d(c)
 
     def __str__(self):
         """ The string representation of this object """
@@ -106,35 +171,23 @@ class Coefficient(ParentContainer):
         copy.info = self.info
         return copy
 
-    def degenerate(self, eps):
+    def degenerate(self, eps, assume_sorted=False):
         """ Find degenerate coefficients with a specified precision
 
         Parameters
         ----------
         eps : float
            the precision above which coefficients are not considered degenerate
+        assume_sorted : bool, optional
+           whether the coefficients are already sorted in ascending order, in which case
+           sorting is skipped. This is the case for eigenvalues from `eigh`.
 
         Returns
         -------
         list of numpy.ndarray
             a list of indices
         """
-        deg = list()
-        sidx = np.argsort(self.c)
-        dc = _diff(self.c[sidx])
-
-        # Degenerate indices
-        idx = (dc < eps).nonzero()[0]
-        if len(idx) == 0:
-            # There are no degenerate coefficients
-            return deg
-
-        # These are the points were we split the degeneracies
-        seps = (_diff(idx) > 1).nonzero()[0]
-        IDX = np.array_split(idx, seps + 1)
-        for idx in IDX:
-            deg.append(_append(sidx[idx], sidx[idx[-1] + 1]))
-        return deg
+        return _degenerate(self.c, eps, assume_sorted)
 
     def sub(self, idx):
         """ Return a new coefficient with only the specified coefficients
@@ -150,7 +203,14 @@ class Coefficient(ParentContainer):
             a new coefficient only containing the requested elements
         """
         idx = self._sanitize_index(idx)
-        sub = self.__class__(self.c[idx].copy(), self.parent)
+        # idx is an integer array, so fancy indexing already returns a copy
+        sub = self.__class__(self.c[idx], self.parent)
+        sub.info = self.info
+        return sub
+
+    def _sub_row(self, i):
+        """ Return a new coefficient with only the `i`'th coefficient (`i` must be non-negative) """
+        sub = self.__class__(self.c[i:i+1].copy(), self.parent)
         sub.info = self.info
         return sub
 
@@ -186,11 +246,12 @@ class Coefficient(ParentContainer):
            the current the coefficient as an array, only returned if `asarray` is true.
         """
         if asarray:
-            for i in range(len(self)):
-                yield self.c[i]
+            # numpy iterates the rows (as views) natively
+            yield from self.c
         else:
+            # slicing the rows is faster than sanitizing the index in sub
             for i in range(len(self)):
-                yield self.sub(i)
+                yield self._sub_row(i)
 
     __iter__ = iter
 
@@ -222,12 +283,13 @@ class State(ParentContainer):
     -----
     This class should be subclassed!
     """
-    __slots__ = ['state']
+    __slots__ = ['state', '_row_idx']
 
     def __init__(self, state, parent=None, **info):
         """ Define a state container with a given set of states """
         super().__init__(parent, **info)
-        self.state = np.atleast_2d(state)
+        self.state = _atleast_2d(state)
+        self._row_idx = None
 
     def __str__(self):
         """ The string representation of this object """
@@ -257,6 +319,14 @@ class State(ParentContainer):
         """ Returns the shape of the state """
         return self.state.shape
 
+    @property
+    def _rows(self):
+        """ Indices of all states (cached), used for selecting a single element per state """
+        n = self.state.shape[0]
+        if self._row_idx is None or len(self._row_idx) != n:
+            self._row_idx = _a.arangei(n)
+        return self._row_idx
+
     def copy(self):
         """ Return a copy (only the state is copied). ``parent`` and ``info`` are passed by reference """
         copy = self.__class__(self.state.copy(), self.parent)
@@ -277,7 +347,14 @@ class State(ParentContainer):
            a new state only containing the requested elements
         """
         idx = self._sanitize_index(idx)
-        sub = self.__class__(self.state[idx].copy(), self.parent)
+        # idx is an integer array, so fancy indexing already returns a copy
+        sub = self.__class__(self.state[idx], self.parent)
+        sub.info = self.info
+        return sub
+
+    def _sub_row(self, i):
+        """ Return a new state with only the `i`'th state (`i` must be non-negative) """
+        sub = self.__class__(self.state[i:i+1].copy(), self.parent)
         sub.info = self.info
         return sub
 
@@ -313,11 +390,12 @@ class State(ParentContainer):
            a state *only* containing individual elements, if `asarray` is true
         """
         if asarray:
-            for i in range(len(self)):
-                yield self.state[i]
+            # numpy iterates the rows (as views) natively
+            yield from self.state
         else:
+            # slicing the rows is faster than sanitizing the index in sub
             for i in range(len(self)):
-                yield self.sub(i)
+                yield self._sub_row(i)
 
     __iter__ = iter
 
@@ -346,10 +424,10 @@ class State(ParentContainer):
             the squared norm for each state
         """
         if sum:
-            return self.inner()
-        return _conj(self.state) * self.state
+            return _inner_diag(self.state)
+        return _abs2(self.state)
 
-    def normalize(self):
+    def normalize(self, in_place=False):
         r""" Return a normalized state where each state has :math:`|\psi|^2=1`
 
         This is roughly equivalent to:
@@ -358,6 +436,13 @@ class State(ParentContainer):
         >>> n = state.norm()
         >>> norm_state = State(state.state / n.reshape(-1, 1))
 
+        Parameters
+        ----------
+        in_place : bool, optional
+           whether the states are normalized *in-place*, in which case this object is returned.
+           This requires a floating point (or complex) state and it also changes the array
+           passed when creating this object (if it was not copied)
+
         Notes
         -----
         This does *not* take into account a possible overlap matrix when non-orthogonal basis sets are used.
@@ -365,10 +450,17 @@ class State(ParentContainer):
         Returns
         -------
         State
-            a new state with all states normalized, otherwise equal to this
+            a new state with all states normalized, otherwise equal to this.
+            If `in_place` is true, this object (normalized) is returned
         """
-        n = self.norm()
-        s = self.__class__(self.state / n.reshape(-1, 1), parent=self.parent)
+        if in_place and self.state.dtype.kind not in 'fc':
+            raise ValueError(self.__class__.__name__ + '.normalize(in_place=True) requires a floating point state')
+        # Multiplying by the reciprocal is cheaper than dividing all elements
+        inv = 1. / self.norm()
+        if in_place:
+            self.state *= inv[:, None]
+            return self
+        s = self.__class__(self.state * inv[:, None], parent=self.parent)
         s.info = self.info
         return s
 
@@ -393,13 +485,13 @@ class State(ParentContainer):
             a matrix with the sum of outer state products
         """
         if right is None:
-            return einsum('ki,kj->ij', self.state, _conj(self.state))
+            return _outer_herm(self.state)
         if not np.array_equal(self.shape, right.shape):
             raise ValueError(self.__class__.__name__ + '.outer requires the objects to have the same shape')
         if align:
             # Align the states
             right = self.align_phase(right, copy=False)
-        return einsum('ki,kj->ij', self.state, _conj(right.state))
+        return _dot(self.state.T, _conj(right.state))
 
     def inner(self, right=None, diagonal=True, align=False):
         r""" Return the inner product as :math:`\mathbf M_{ij} = \langle\psi_i|\psi'_j\rangle`
@@ -425,8 +517,9 @@ class State(ParentContainer):
         """
         if right is None:
             if diagonal:
-                return einsum('ij,ij->i', _conj(self.state), self.state).real
-            return _inner(self.state, self.state.T)
+                return _inner_diag(self.state)
+            # a single GEMM, BLAS handles the transposed operand without copying
+            return _dot(_conj(self.state), self.state.T)
 
         # They *must* have same number of basis points per state
         if self.shape[-1] != right.shape[-1]:
@@ -444,7 +537,7 @@ class State(ParentContainer):
             elif self.shape[0] > right.shape[0]:
                 return einsum('ij,kj->k', _conj(self.state), right.state)
             return einsum('ij,ij->i', _conj(self.state), right.state)
-        return _conj(self.state).dot(right.state.T)
+        return _dot(_conj(self.state), right.state.T)
 
     def phase(self, method='max', return_indices=False):
         r""" Calculate the Euler angle (phase) for the elements of the state, in the range :math:`]-\pi;\pi]`
@@ -457,14 +550,23 @@ class State(ParentContainer):
         return_indices : bool, optional
            return indices for the elements used when ``method=='max'``
         """
-        if method == 'max':
-            idx = _argmax(_abs(self.state), 1)
-            if return_indices:
-                return _phase(self.state[_a.arangei(len(self)), idx]), idx
-            return _phase(self.state[_a.arangei(len(self)), idx])
-        elif method == 'all':
-            return _phase(self.state)
-        raise ValueError(self.__class__.__name__ + '.phase only accepts method in ["max", "all"]')
+        try:
+            name = self._phase_methods[method]
+        except (KeyError, TypeError):
+            raise ValueError(self.__class__.__name__ + '.phase only accepts method in ["max", "all"]')
+        return getattr(self, name)(return_indices)
+
+    def _phase_max(self, return_indices):
+        idx = _argmax(_abs(self.state), 1)
+        if return_indices:
+            return _phase(self.state[self._rows, idx]), idx
+        return _phase(self.state[self._rows, idx])
+
+    def _phase_all(self, return_indices):
+        return _phase(self.state)
+
+    # Look-up table for the phase methods (names, to allow overriding them in sub-classes)
+    _phase_methods = {'max': '_phase_max', 'all': '_phase_all'}
 
     def align_phase(self, other, copy=False):
         r""" Align `other.state` with the phases for this state, a copy of `other` is returned with rotated elements
@@ -483,13 +585,17 @@ class State(ParentContainer):
         --------
         align_norm : re-order states such that site-norms have a smaller residual
         """
-        phase, idx = self.phase(return_indices=True)
-        other_phase = _phase(other.state[_a.arangei(len(other)), idx])
+        if other is self or other.state is self.state or len(other) == 0:
+            # No states require rotation
+            if copy:
+                return other.copy()
+            return other
 
-        # Calculate absolute phase difference
-        abs_phase = _abs((phase - other_phase + _pi) % _pi2 - _pi)
+        phase, idx = self.phase(return_indices=True)
+        other_phase = _phase(other.state[other._rows, idx])
 
-        idx = (abs_phase > _pi / 2).nonzero()[0]
+        # A wrapped phase difference |dphi| > pi / 2 is equivalent to cos(dphi) < 0
+        idx = (np.cos(phase - other_phase) < 0).nonzero()[0]
         if len(idx) == 0:
             if copy:
                 return other.copy()
@@ -582,14 +688,15 @@ class State(ParentContainer):
         # Convert angle to complex phase
         phi = np.exp(1j * phi)
         s = self.state.view()
+        # The squared amplitude has the same maximum as the amplitude (but avoids the sqrt)
         if individual:
-            for i in range(len(self)):
-                # Find the maximum amplitude index
-                idx = _argmax(_abs(s[i, :]))
-                s[i, :] *= phi * _conj(s[i, idx] / _abs(s[i, idx]))
+            # Find the maximum amplitude index for each state
+            idx = _argmax(_abs2(s), 1)
+            s_max = s[self._rows, idx]
+            s *= (phi * _conj(s_max / _abs(s_max))).reshape(-1, 1)
         else:
             # Find the maximum amplitude index among all elements
-            idx = np.unravel_index(_argmax(_abs(s)), s.shape)
+            idx = np.unravel_index(_argmax(_abs2(s)), s.shape)
             s *= phi * _conj(s[idx] / _abs(s[idx]))
 
     # def toStateC(self, norm=1.):
@@ -676,7 +783,7 @@ class StateC(State):
     def __init__(self, state, c, parent=None, **info):
         """ Define a state container with a given set of states and coefficients for the states """
         super().__init__(state, parent, **info)
-        self.c = np.atleast_1d(c)
+        self.c = _atleast_1d(c)
         if len(self.c) != len(self.state):
             raise ValueError(self.__class__.__name__ + ' could not be created with coefficients and states '
                              'having unequal length.')
@@ -687,7 +794,7 @@ class StateC(State):
         copy.info = self.info
         return copy
 
-    def normalize(self):
+    def normalize(self, in_place=False):
         r""" Return a normalized state where each state has :math:`|\psi|^2=1`
 
         This is roughly equivalent to:
@@ -697,13 +804,26 @@ class StateC(State):
         >>> norm_state = StateC(state.state / n.reshape(-1, 1), state.c.copy())
         >>> norm_state.c[0] == 1
 
+        Parameters
+        ----------
+        in_place : bool, optional
+           whether the states are normalized *in-place*, in which case this object is returned.
+           This requires a floating point (or complex) state and it also changes the array
+           passed when creating this object (if it was not copied)
+
         Returns
         -------
-        State
-            a new state with all states normalized, otherwise equal to this
+        StateC
+            a new state with all states normalized, otherwise equal to this.
+            If `in_place` is true, this object (normalized) is returned
         """
-        n = self.norm()
-        s = self.__class__(self.state / n.reshape(-1, 1), self.c.copy(), parent=self.parent)
+        if in_place and self.state.dtype.kind not in 'fc':
+            raise ValueError(self.__class__.__name__ + '.normalize(in_place=True) requires a floating point state')
+        inv = 1. / self.norm()
+        if in_place:
+            self.state *= inv[:, None]
+            return self
+        s = self.__class__(self.state * inv[:, None], self.c.copy(), parent=self.parent)
         s.info = self.info
         return s
 
@@ -720,10 +840,12 @@ class StateC(State):
         numpy.ndarray
             a matrix with the sum of outer state products
         """
+        # scaling the (transposed) states by the coefficients reduces the sum to a single matrix product
         if idx is None:
-            return einsum('k,ki,kj->ij', self.c, self.state, _conj(self.state))
+            return _dot(self.state.T * self.c, _conj(self.state))
         idx = self._sanitize_index(idx)
-        return einsum('k,ki,kj->ij', self.c[idx], self.state[idx], _conj(self.state[idx]))
+        state = self.state[idx]
+        return _dot(state.T * self.c[idx], _conj(state))
 
     def sort(self, ascending=True):
         """ Sort and return a new `StateC` by sorting the coefficients (default to ascending)
@@ -733,41 +855,29 @@ class StateC(State):
         ascending : bool, optional
             sort the contained elements ascending, else they will be sorted descending
         """
-        if ascending:
-            idx = np.argsort(self.c)
-        else:
-            idx = np.argsort(-self.c)
+        idx = np.argsort(self.c)
+        if not ascending:
+            # reversing the indices avoids negating the coefficients
+            idx = idx[::-1]
         return self.sub(idx)
 
-    def degenerate(self, eps):
+    def degenerate(self, eps, assume_sorted=False):
         """ Find degenerate coefficients with a specified precision
 
         Parameters
         ----------
         eps : float
            the precision above which coefficients are not considered degenerate
+        assume_sorted : bool, optional
+           whether the coefficients are already sorted in ascending order, in which case
+           sorting is skipped. This is the case for eigenvalues from `eigh`.
 
         Returns
         -------
         list of numpy.ndarray
             a list of indices
         """
-        deg = list()
-        sidx = np.argsort(self.c)
-        dc = _diff(self.c[sidx])
-
-        # Degenerate indices
-        idx = (dc < eps).nonzero()[0]
-        if len(idx) == 0:
-            # There are no degenerate coefficients
-            return deg
-
-        # These are the points were we split the degeneracies
-        seps = (_diff(idx) > 1).nonzero()[0]
-        IDX = np.array_split(idx, seps + 1)
-        for idx in IDX:
-            deg.append(_append(sidx[idx], sidx[idx[-1] + 1]))
-        return deg
+        return _degenerate(self.c, eps, assume_sorted)
 
     def sub(self, idx):
         """ Return a new state with only the specified states
@@ -787,6 +897,12 @@ class StateC(State):
         sub.info = self.info
         return sub
 
+    def _sub_row(self, i):
+        """ Return a new state with only the `i`'th state (`i` must be non-negative) """
+        sub = self.__class__(self.state[i:i+1].copy(), self.c[i:i+1].copy(), self.parent)
+        sub.info = self.info
+        return sub
+
     def asState(self):
         s = State(self.state.copy(), self.parent)
         s.info = self.info
@@ -68,6 +68,25 @@ def test_coefficient_iter():
         assert C == c.c[i]
 
 
+def test_coefficient_degenerate():
+    c = Coefficient([3., 1., 1.5, 1., 3., 3., 2.])
+    deg = c.degenerate(1e-8)
+    assert len(deg) == 2
+    assert np.allclose(np.sort(deg[0]), [1, 3])
+    assert np.allclose(np.sort(deg[1]), [0, 4, 5])
+    assert len(Coefficient(ar(6)).degenerate(1e-8)) == 0
+
+
+def test_coefficient_degenerate_sorted():
+    c = Coefficient([1., 1., 1.5, 2., 3., 3., 3.])
+    deg = c.degenerate(1e-8, assume_sorted=True)
+    assert len(deg) == 2
+    assert np.allclose(deg[0], [0, 1])
+    assert np.allclose(deg[1], [4, 5, 6])
+    for d, ds in zip(c.degenerate(1e-8), deg):
+        assert np.allclose(d, ds)
+
+
 def test_state_creation1():
     state = State(ar(6))
     assert len(state) == 1
@@ -99,6 +118,29 @@ def test_state_norm1():
     assert state.norm()[0] == pytest.approx(1)
 
 
+def test_state_norm_in_place():
+    state = State(ar(4, 6))
+    norm = state.normalize()
+    assert state.normalize(in_place=True) is state
+    assert np.allclose(state.norm(), 1)
+    assert np.allclose(state.state, norm.state)
+
+    # integer states cannot be normalized in-place
+    state = State(np.arange(24).reshape(4, 6))
+    with pytest.raises(ValueError):
+        state.normalize(in_place=True)
+    assert np.allclose(state.normalize().norm(), 1)
+
+
+def test_state_norm2_complex():
+    state = State(ar(4, 6) + 1j * ar(4, 6))
+    norm2 = state.norm2(False)
+    assert norm2.dtype == np.float64
+    assert np.allclose(norm2, np.absolute(state.state) ** 2)
+    assert np.allclose(state.norm2(), norm2.sum(1))
+    assert np.allclose(state.inner(), state.norm2())
+
+
 def test_state_sub1():
     state = ar(10, 10)
     state = State(state)
@@ -133,6 +175,19 @@ def test_state_outer1():
     assert np.allclose(out, o)
 
 
+@pytest.mark.parametrize("shape", [(10, 10), (2, 20)])
+@pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+def test_state_outer_complex(shape, dtype):
+    state = (np.random.rand(*shape) + 1j * np.random.rand(*shape)).astype(dtype)
+    out = State(state).outer()
+    o = np.zeros([shape[1], shape[1]], dtype=dtype)
+    for s in state:
+        o += outer(s)
+    assert out.dtype == dtype
+    assert np.allclose(out, o, atol=1e-5)
+    assert np.allclose(out, out.conj().T)
+
+
 def test_state_inner1():
     state = ar(10, 10)
     state = State(state)
@@ -171,6 +226,14 @@ def test_state_phase_all():
     assert np.allclose(ph1, ph2 + np.pi)
 
 
+def test_state_phase_method_fail():
+    state = State(np.random.rand(4, 4))
+    with pytest.raises(ValueError):
+        state.phase('unknown')
+    with pytest.raises(ValueError):
+        state.phase(['max'])
+
+
 def test_state_align_phase1():
     state = ortho_matrix(10)
     state1 = State(state)
@@ -181,6 +244,14 @@ def test_state_align_phase1():
     assert np.allclose(state1.state, align2.state)
 
 
+def test_state_align_phase_self():
+    state = State(ortho_matrix(10))
+    assert state.align_phase(state) is state
+    align = state.align_phase(state, copy=True)
+    assert align is not state
+    assert np.allclose(state.state, align.state)
+
+
 def test_state_align_norm1():
     state = ortho_matrix(10)
     state1 = State(state)
@@ -237,6 +308,31 @@ def test_state_rotate_1():
     assert pytest.approx(np.angle(s.state[1, 1]), np.pi / 2)
 
 
+@pytest.mark.parametrize("phi", [0., np.pi / 3])
+def test_state_rotate_individual(phi):
+    state = np.random.rand(6, 8) - 0.5 + 1j * (np.random.rand(6, 8) - 0.5)
+    ref = state.copy()
+    for i in range(len(ref)):
+        idx = np.argmax(np.absolute(ref[i]))
+        ref[i] *= np.exp(1j * phi) * np.conjugate(ref[i, idx] / np.absolute(ref[i, idx]))
+    s = State(state.copy())
+    s.rotate(phi, individual=True)
+    assert np.allclose(s.state, ref)
+    idx = np.argmax(np.absolute(s.state), 1)
+    assert np.allclose(np.angle(s.state[np.arange(len(s)), idx]), phi)
+
+
+@pytest.mark.parametrize("phi", [0., np.pi / 3])
+def test_state_rotate_all(phi):
+    state = np.random.rand(6, 8) - 0.5 + 1j * (np.random.rand(6, 8) - 0.5)
+    idx = np.unravel_index(np.argmax(np.absolute(state)), state.shape)
+    ref = state * np.exp(1j * phi) * np.conjugate(state[idx] / np.absolute(state[idx]))
+    s = State(state.copy())
+    s.rotate(phi)
+    assert np.allclose(s.state, ref)
+    assert np.angle(s.state[idx]) == pytest.approx(phi)
+
+
 def test_cstate_creation1():
     state = StateC(ar(6), 1)
     assert len(state) == 1
@@ -287,10 +383,22 @@ def test_cstate_sort1():
     assert np.allclose(c, sort_descending.c)
 
 
+def test_cstate_degenerate():
+    state = StateC(ar(4, 4), [1., 2., 1., 2.])
+    deg = state.degenerate(1e-8)
+    assert len(deg) == 2
+    assert np.allclose(np.sort(deg[0]), [0, 2])
+    assert np.allclose(np.sort(deg[1]), [1, 3])
+
+
 def test_cstate_norm1():
     state = StateC(ar(10, 10), ar(10)).normalize()
     assert len(state) == 10
     assert np.allclose(state.norm(), 1)
+    state = StateC(ar(10, 10) + 1, ar(10))
+    assert state.normalize(in_place=True) is state
+    assert np.allclose(state.norm(), 1)
+    assert np.allclose(state.c, ar(10))
 
 
 def test_cstate_outer1():